@@ -4,19 +4,21 @@ Main entry point for the Persona-Driven Document Intelligence system.
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
-import time
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Any
 
-from src.document_processor import DocumentProcessor
-from src.persona_analyzer import PersonaAnalyzer
-from src.relevance_scorer import RelevanceScorer
-from src.output_formatter import OutputFormatter
+# Add src to Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(project_root, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+# Cap native thread pools before numpy/sklearn are imported
+from _env import cap_native_threads
+cap_native_threads()
 
 # Configure logging
 logging.basicConfig(
@@ -67,6 +69,11 @@ def main():
         default=5,
         help='Maximum number of sub-sections per section'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Cache persona/job analysis results across runs in the per-user cache directory'
+    )
     
     args = parser.parse_args()
     
@@ -75,64 +82,16 @@ def main():
         logger.error(f"Documents path does not exist: {args.documents}")
         sys.exit(1)
     
-    start_time = time.time()
+    # Import the pipeline only once the arguments are known to be valid
+    try:
+        import pipeline
+    except ImportError as e:
+        print(f"Import error: {e}")
+        print("Please run 'python setup_models.py' first to install dependencies")
+        sys.exit(1)
     
     try:
-        # Initialize components
-        logger.info("Initializing document processing components...")
-        document_processor = DocumentProcessor()
-        persona_analyzer = PersonaAnalyzer()
-        relevance_scorer = RelevanceScorer()
-        output_formatter = OutputFormatter()
-        
-        # Process documents
-        logger.info(f"Processing documents from: {args.documents}")
-        documents = document_processor.process_documents(args.documents)
-        
-        if not documents:
-            logger.error("No documents found or processed successfully")
-            sys.exit(1)
-        
-        # Analyze persona and job
-        logger.info("Analyzing persona and job requirements...")
-        persona_profile = persona_analyzer.analyze_persona(args.persona)
-        job_requirements = persona_analyzer.analyze_job(args.job)
-        
-        # Score and rank sections
-        logger.info("Scoring document sections for relevance...")
-        ranked_sections = relevance_scorer.score_sections(
-            documents, persona_profile, job_requirements, args.max_sections
-        )
-        
-        # Extract sub-sections
-        logger.info("Extracting relevant sub-sections...")
-        sub_sections = relevance_scorer.extract_subsections(
-            ranked_sections, persona_profile, job_requirements, args.max_subsections
-        )
-        
-        # Format output
-        logger.info("Formatting output...")
-        output_data = output_formatter.format_output(
-            documents=documents,
-            persona=args.persona,
-            job=args.job,
-            sections=ranked_sections,
-            subsections=sub_sections,
-            processing_time=time.time() - start_time
-        )
-        
-        # Save output
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
-        processing_time = time.time() - start_time
-        logger.info(f"Processing completed in {processing_time:.2f} seconds")
-        logger.info(f"Output saved to: {args.output}")
-        
-        # Validate processing time constraint
-        if processing_time > 60:
-            logger.warning(f"Processing time ({processing_time:.2f}s) exceeded 60-second constraint")
-        
+        pipeline.run(**vars(args))
     except Exception as e:
         logger.error(f"Error during processing: {str(e)}")
         sys.exit(1)
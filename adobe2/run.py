@@ -4,13 +4,13 @@ Simple runner script that handles imports properly.
 """
 
 import argparse
-import json
+import functools
 import logging
 import os
 import sys
 import time
+import traceback
 from datetime import datetime
-from pathlib import Path
 
 # Add src to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -18,15 +18,9 @@ src_path = os.path.join(project_root, 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-try:
-    from document_processor import DocumentProcessor
-    from persona_analyzer import PersonaAnalyzer  
-    from relevance_scorer import RelevanceScorer
-    from output_formatter import OutputFormatter
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Please run 'python setup_models.py' first to install dependencies")
-    sys.exit(1)
+# Cap native thread pools before numpy/sklearn are imported
+from _env import cap_native_threads
+cap_native_threads()
 
 # Configure logging
 logging.basicConfig(
@@ -36,8 +30,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Main execution function."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description='Persona-Driven Document Intelligence System'
     )
@@ -77,83 +72,48 @@ def main():
         default=5,
         help='Maximum number of sub-sections per section'
     )
-    
-    args = parser.parse_args()
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Cache persona/job analysis results across runs in the per-user cache directory'
+    )
+    return parser
+
+
+def main(argv=None):
+    """Main execution function."""
+    args = _build_parser().parse_args(argv)
     
     # Validate inputs
     if not os.path.exists(args.documents):
         logger.error(f"Documents path does not exist: {args.documents}")
         sys.exit(1)
     
+    # Import the pipeline only once the arguments are known to be valid
+    try:
+        import pipeline
+    except ImportError as e:
+        print(f"Import error: {e}")
+        print("Please run 'python setup_models.py' first to install dependencies")
+        sys.exit(1)
+    
     start_time = time.time()
     
     try:
-        # Initialize components
-        logger.info("Initializing document processing components...")
-        document_processor = DocumentProcessor()
-        persona_analyzer = PersonaAnalyzer()
-        relevance_scorer = RelevanceScorer()
-        output_formatter = OutputFormatter()
-        
-        # Process documents
-        logger.info(f"Processing documents from: {args.documents}")
-        documents = document_processor.process_documents(args.documents)
-        
-        if not documents:
-            logger.error("No documents found or processed successfully")
-            sys.exit(1)
-        
-        # Analyze persona and job
-        logger.info("Analyzing persona and job requirements...")
-        persona_profile = persona_analyzer.analyze_persona(args.persona)
-        job_requirements = persona_analyzer.analyze_job(args.job)
-        
-        # Score and rank sections
-        logger.info("Scoring document sections for relevance...")
-        ranked_sections = relevance_scorer.score_sections(
-            documents, persona_profile, job_requirements, args.max_sections
-        )
-        
-        # Extract sub-sections
-        logger.info("Extracting relevant sub-sections...")
-        sub_sections = relevance_scorer.extract_subsections(
-            ranked_sections, persona_profile, job_requirements, args.max_subsections
-        )
-        
-        # Format output
-        logger.info("Formatting output...")
-        output_data = output_formatter.format_output(
-            documents=documents,
-            persona=args.persona,
-            job=args.job,
-            sections=ranked_sections,
-            subsections=sub_sections,
-            processing_time=time.time() - start_time
-        )
-        
-        # Save output
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
+        output_data = pipeline.run(**vars(args))
         processing_time = time.time() - start_time
-        logger.info(f"Processing completed in {processing_time:.2f} seconds")
-        logger.info(f"Output saved to: {args.output}")
-        
-        # Validate processing time constraint
-        if processing_time > 60:
-            logger.warning(f"Processing time ({processing_time:.2f}s) exceeded 60-second constraint")
+        metadata = output_data["metadata"]
         
         # Print summary
         print(f"\n=== PROCESSING SUMMARY ===")
-        print(f"Documents processed: {len(documents)}")
-        print(f"Sections extracted: {len(ranked_sections)}")
-        print(f"Sub-sections extracted: {len(sub_sections)}")
+        print(f"Documents processed: {metadata['total_documents_processed']}")
+        print(f"Sections extracted: {metadata['top_sections_selected']}")
+        print(f"Sub-sections extracted: {metadata['subsections_extracted']}")
         print(f"Processing time: {processing_time:.2f}s")
         print(f"Output saved to: {args.output}")
         
     except Exception as e:
         logger.error(f"Error during processing: {str(e)}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
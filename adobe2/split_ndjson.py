@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Split an NDJSON results file into one pretty-printed JSON file per line.
+
+For consumers that still expect the legacy per-scenario outputs, e.g.
+comprehensive_test.ndjson -> comprehensive_test_1.json, comprehensive_test_2.json, ...
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add src to Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(project_root, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from output_formatter import write_output
+
+
+def split_ndjson(ndjson_path, output_dir=None):
+    """
+    Write each JSON document of an NDJSON file to its own numbered file.
+    
+    Args:
+        ndjson_path: Path to the NDJSON file
+        output_dir: Directory for the split files (defaults to the NDJSON file's directory)
+    
+    Returns:
+        List of written file paths, in line order
+    """
+    source = Path(ndjson_path)
+    target_dir = Path(output_dir) if output_dir else source.parent
+    written = []
+    
+    with open(source, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            output_file = target_dir / f"{source.stem}_{len(written) + 1}.json"
+            write_output(json.loads(line), str(output_file))
+            written.append(str(output_file))
+    
+    return written
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Split an NDJSON results file into per-line JSON files')
+    parser.add_argument('ndjson', type=str, help='Path to the NDJSON file')
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default=None,
+        help='Directory for the split JSON files (defaults to the NDJSON file directory)'
+    )
+    args = parser.parse_args(argv)
+    
+    for output_file in split_ndjson(args.ndjson, args.output_dir):
+        print(output_file)
+
+
+if __name__ == "__main__":
+    main()
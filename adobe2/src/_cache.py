@@ -0,0 +1,139 @@
+"""
+In-memory and persistent on-disk memoization for expensive text analysis results.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def memoize(attr: str, maxsize: int = 128) -> Callable:
+    """
+    Cache a method's return value in a per-instance LRU keyed by its text argument.
+    
+    The decorated method must take a single string argument after ``self``,
+    and the instance must hold an ``OrderedDict`` under ``attr``.
+    
+    Args:
+        attr: Name of the instance attribute holding the cache
+        maxsize: Maximum number of entries kept before evicting the oldest
+    
+    Returns:
+        Decorator for the method to memoize
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, text: str) -> Any:
+            cache = getattr(self, attr)
+            if text in cache:
+                cache.move_to_end(text)
+                return cache[text]
+            
+            result = func(self, text)
+            
+            cache[text] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+# Bump to invalidate every on-disk entry written by older releases
+_DISK_CACHE_VERSION = 1
+
+
+def user_cache_dir(name: str) -> Path:
+    """
+    Get a per-user cache directory for this project.
+    
+    Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+    
+    Args:
+        name: Subdirectory for one kind of cached result
+    
+    Returns:
+        Path of the cache directory (not created)
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'persona-document-intelligence' / name
+
+
+def _module_source_digest(module_name: str) -> str:
+    """Hash the source file of a module so code changes invalidate its cache entries."""
+    try:
+        with open(sys.modules[module_name].__file__, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except (KeyError, AttributeError, TypeError, OSError):
+        return ''
+
+
+def disk_memoize(attr: str) -> Callable:
+    """
+    Cache a method's return value on disk, keyed by its text argument.
+    
+    The decorated method must take a single string argument after ``self``.
+    Caching is opt-in per instance: results are only stored when the
+    instance holds a directory under ``attr``; when it holds None the method
+    runs uncached. Entries are pickled to ``<dir>/<sha1>.pkl``, where the
+    key also covers a cache version and a hash of the defining module's
+    source, so code changes never serve stale results.
+    
+    Args:
+        attr: Name of the instance attribute holding the cache directory
+    
+    Returns:
+        Decorator for the method to memoize
+    """
+    def decorator(func: Callable) -> Callable:
+        key_prefix = f"{_DISK_CACHE_VERSION}\0{_module_source_digest(func.__module__)}\0{func.__qualname__}\0"
+        
+        @functools.wraps(func)
+        def wrapper(self, text: str) -> Any:
+            cache_dir: Optional[Path] = getattr(self, attr)
+            if cache_dir is None:
+                return func(self, text)
+            
+            digest = hashlib.sha1(f"{key_prefix}{text}".encode('utf-8')).hexdigest()
+            cache_file = cache_dir / f"{digest}.pkl"
+            
+            # Serve from cache when available
+            try:
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            
+            result = func(self, text)
+            
+            # Write atomically so concurrent runs never see partial files
+            tmp_path = None
+            try:
+                cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_file)
+            except Exception as e:
+                logger.warning(f"Could not write cache entry {cache_file}: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
@@ -0,0 +1,18 @@
+"""
+Process environment setup shared by the command-line entry points.
+"""
+
+import os
+
+
+def cap_native_threads() -> None:
+    """
+    Cap the native BLAS/OpenMP thread pools at half the available CPUs.
+    
+    Must run before numpy or scikit-learn are imported, since the pools are
+    sized when those libraries load. Values already set in the environment
+    are left untouched.
+    """
+    threads = os.environ.setdefault('OMP_NUM_THREADS', str(max(1, (os.cpu_count() or 1) // 2)))
+    os.environ.setdefault('OPENBLAS_NUM_THREADS', threads)
+    os.environ.setdefault('MKL_NUM_THREADS', threads)
@@ -2,19 +2,31 @@
 Document processor for extracting and structuring content from PDF files.
 """
 
+import functools
 import logging
 import os
 import re
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-import pdfplumber
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+    import pdfplumber
 
 logger = logging.getLogger(__name__)
 
+# Sections and documents are created in bulk, so use slotted dataclasses
+# (no per-instance __dict__) where the running Python supports them
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DocumentSection:
     """Represents a section within a document."""
     title: str
@@ -23,14 +35,23 @@ class DocumentSection:
     section_number: Optional[str] = None
     start_position: Optional[int] = None
     end_position: Optional[int] = None
+    first_section_num: Optional[float] = field(init=False, default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Parse the leading section number once for structural scoring."""
+        if self.section_number:
+            try:
+                self.first_section_num = float(self.section_number.split('.')[0])
+            except (ValueError, IndexError):
+                pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessedDocument:
     """Represents a processed document with extracted sections."""
     filename: str
     total_pages: int
-    sections: List[DocumentSection]
+    sections: Sequence[DocumentSection]
     metadata: Dict[str, any]
 
 
@@ -39,20 +60,29 @@ class DocumentProcessor:
     
     def __init__(self):
         """Initialize the document processor."""
-        self.section_patterns = [
-            r'^(\d+\.?\d*\.?\d*)\s+(.+)$',  # Numbered sections (1.1, 1.1.1)
-            r'^([IVX]+\.?\d*)\s+(.+)$',     # Roman numerals
-            r'^(Abstract|Introduction|Background|Methodology|Methods|Results|Discussion|Conclusion|References).*$',
-            r'^(Chapter \d+|Section \d+).*$',
-            r'^([A-Z][A-Z\s]+)$',           # ALL CAPS headers
-        ]
+        # Header patterns fused into one alternation, tried in order
+        self.section_header_pattern = re.compile(
+            r'^(?:'
+            r'(?P<number>\d+\.?\d*\.?\d*)\s+(?P<numbered_title>.+)'  # Numbered sections (1.1, 1.1.1)
+            r'|(?P<roman>[IVX]+\.?\d*)\s+(?P<roman_title>.+)'      # Roman numerals
+            r'|(?:Abstract|Introduction|Background|Methodology|Methods|Results|Discussion|Conclusion|References).*'
+            r'|(?:Chapter \d+|Section \d+).*'
+            r'|[A-Z][A-Z\s]+'                                       # ALL CAPS headers
+            r')$',
+            re.IGNORECASE
+        )
+        self.section_number_pattern = re.compile(r'^(\d+\.?\d*\.?\d*)')
+        self.roman_number_pattern = re.compile(r'^([IVX]+)')
+        # Stripped content of each non-blank line, found in one scan per page
+        self.nonempty_line_pattern = re.compile(r'^[^\S\n]*(\S(?:[^\n]*\S)?)', re.MULTILINE)
     
-    def process_documents(self, documents_path: str) -> List[ProcessedDocument]:
+    def process_documents(self, documents_path: str, load_metadata: bool = True) -> List[ProcessedDocument]:
         """
         Process documents from a file or directory.
         
         Args:
             documents_path: Path to PDF file or directory containing PDFs
+            load_metadata: Whether to read the PDF document info (title, author, ...)
             
         Returns:
             List of processed documents
@@ -61,27 +91,51 @@ class DocumentProcessor:
         
         if os.path.isfile(documents_path):
             if documents_path.lower().endswith('.pdf'):
-                doc = self._process_single_document(documents_path)
+                doc = self._process_single_document(documents_path, load_metadata=load_metadata)
                 if doc:
                     documents.append(doc)
         elif os.path.isdir(documents_path):
-            pdf_files = list(Path(documents_path).glob('*.pdf'))
+            # One scandir pass yields paths and sizes without extra stat calls
+            with os.scandir(documents_path) as entries:
+                pdf_files = [
+                    (entry.path, entry.stat().st_size) for entry in entries
+                    if entry.name.lower().endswith('.pdf') and entry.is_file()
+                ]
             logger.info(f"Found {len(pdf_files)} PDF files")
             
-            for pdf_file in pdf_files:
-                doc = self._process_single_document(str(pdf_file))
-                if doc:
-                    documents.append(doc)
+            pdf_paths = [pdf_path for pdf_path, _ in pdf_files]
+            file_sizes = [file_size for _, file_size in pdf_files]
+            process_single = functools.partial(self._process_single_document, load_metadata=load_metadata)
+            processed = None
+            if len(pdf_paths) > 1:
+                # Parse PDFs in parallel; map keeps the original file order
+                max_workers = min(os.cpu_count() or 1, len(pdf_paths))
+                try:
+                    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                        processed = list(executor.map(process_single, pdf_paths, file_sizes, chunksize=1))
+                except (BrokenProcessPool, OSError) as e:
+                    logger.warning(f"Parallel PDF processing unavailable, processing serially: {e}")
+            if processed is None:
+                processed = [process_single(pdf_path, file_size=file_size) for pdf_path, file_size in pdf_files]
+            
+            documents.extend(doc for doc in processed if doc)
         
         logger.info(f"Successfully processed {len(documents)} documents")
         return documents
     
-    def _process_single_document(self, pdf_path: str) -> Optional[ProcessedDocument]:
+    def _process_single_document(
+        self,
+        pdf_path: str,
+        file_size: Optional[int] = None,
+        load_metadata: bool = True
+    ) -> Optional[ProcessedDocument]:
         """
         Process a single PDF document.
         
         Args:
             pdf_path: Path to the PDF file
+            file_size: File size in bytes when already known from a directory scan
+            load_metadata: Whether to read the PDF document info
             
         Returns:
             ProcessedDocument or None if processing failed
@@ -89,112 +143,147 @@ class DocumentProcessor:
         try:
             logger.info(f"Processing document: {pdf_path}")
             
-            with pdfplumber.open(pdf_path) as pdf:
-                sections = []
-                all_text = ""
-                
-                # Extract text from all pages
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        all_text += f"\n--- PAGE {page_num} ---\n{page_text}"
-                
-                # Extract sections
-                sections = self._extract_sections(all_text)
+            page_texts, pdf_metadata = self._read_pdf(pdf_path, load_metadata)
+            
+            # Extract sections straight from the per-page lines
+            sections = list(self._iter_sections(page_texts))
+            logger.info(f"Extracted {len(sections)} sections")
+            
+            # Create document metadata
+            metadata = {
+                'file_size': file_size if file_size is not None else os.path.getsize(pdf_path),
+                'creation_date': None,
+                'title': None
+            }
+            metadata.update(pdf_metadata)
+            
+            return ProcessedDocument(
+                filename=os.path.basename(pdf_path),
+                total_pages=len(page_texts),
+                sections=sections,
+                metadata=metadata
+            )
                 
-                # Create document metadata
-                metadata = {
-                    'file_size': os.path.getsize(pdf_path),
-                    'creation_date': None,
-                    'title': None
-                }
+        except Exception as e:
+            logger.error(f"Error processing {pdf_path}: {e}")
+            return None
+    
+    def _read_pdf(self, pdf_path: str, load_metadata: bool = True) -> Tuple[List[Optional[str]], Dict[str, Any]]:
+        """
+        Read per-page text and document info from a PDF.
+        
+        Uses PyMuPDF when installed and falls back to pdfplumber.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            load_metadata: Whether to read the document info; skipped when False
+        
+        Returns:
+            Tuple of page texts (in page order) and PDF metadata fields
+        """
+        pdf_metadata = {}
+        
+        if pymupdf is not None:
+            with pymupdf.open(pdf_path) as pdf:
+                page_texts = [page.get_text("text") for page in pdf]
                 
                 # Try to extract PDF metadata
                 try:
-                    if pdf.metadata:
-                        metadata.update({
-                            'title': pdf.metadata.get('Title'),
-                            'author': pdf.metadata.get('Author'),
-                            'subject': pdf.metadata.get('Subject'),
-                            'creation_date': pdf.metadata.get('CreationDate')
-                        })
+                    if load_metadata and pdf.metadata:
+                        pdf_metadata = {
+                            'title': pdf.metadata.get('title') or None,
+                            'author': pdf.metadata.get('author') or None,
+                            'subject': pdf.metadata.get('subject') or None,
+                            'creation_date': pdf.metadata.get('creationDate') or None
+                        }
                 except Exception as e:
                     logger.warning(f"Could not extract metadata from {pdf_path}: {e}")
-                
-                return ProcessedDocument(
-                    filename=os.path.basename(pdf_path),
-                    total_pages=len(pdf.pages),
-                    sections=sections,
-                    metadata=metadata
-                )
-                
-        except Exception as e:
-            logger.error(f"Error processing {pdf_path}: {e}")
-            return None
+            
+            return page_texts, pdf_metadata
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            page_texts = [page.extract_text() for page in pdf.pages]
+            
+            # Try to extract PDF metadata
+            try:
+                if load_metadata and pdf.metadata:
+                    pdf_metadata = {
+                        'title': pdf.metadata.get('Title'),
+                        'author': pdf.metadata.get('Author'),
+                        'subject': pdf.metadata.get('Subject'),
+                        'creation_date': pdf.metadata.get('CreationDate')
+                    }
+            except Exception as e:
+                logger.warning(f"Could not extract metadata from {pdf_path}: {e}")
+        
+        return page_texts, pdf_metadata
+    
+    def _iter_page_lines(self, page_texts: List[Optional[str]]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield stripped, non-blank text lines tagged with their page number.
+        
+        Args:
+            page_texts: Per-page text in page order
+        
+        Yields:
+            Tuples of (page number, line)
+        """
+        for page_num, page_text in enumerate(page_texts, 1):
+            if page_text:
+                for match in self.nonempty_line_pattern.finditer(page_text):
+                    yield page_num, match.group(1)
     
-    def _extract_sections(self, text: str) -> List[DocumentSection]:
+    def _iter_sections(self, page_texts: List[Optional[str]]) -> Iterator[DocumentSection]:
         """
-        Extract sections from document text.
+        Extract sections from per-page document text.
         
         Args:
-            text: Full document text
+            page_texts: Per-page text in page order
             
-        Returns:
-            List of document sections
+        Yields:
+            Document sections as soon as each one is complete
         """
-        sections = []
-        lines = text.split('\n')
+        found_section = False
         current_section = None
         current_content = []
-        current_page = 1
         
-        for line in lines:
-            line = line.strip()
-            
-            # Track page numbers
-            if line.startswith('--- PAGE '):
-                try:
-                    current_page = int(line.split()[2])
-                except (IndexError, ValueError):
-                    pass
-                continue
-            
+        for page_num, line in self._iter_page_lines(page_texts):
             # Check if line is a section header
             section_match = self._is_section_header(line)
             if section_match:
                 # Save previous section
                 if current_section and current_content:
                     current_section.content = '\n'.join(current_content).strip()
-                    sections.append(current_section)
+                    yield current_section
+                    found_section = True
                 
                 # Start new section
                 current_section = DocumentSection(
                     title=section_match,
                     content="",
-                    page_number=current_page,
+                    page_number=page_num,
                     section_number=self._extract_section_number(section_match)
                 )
                 current_content = []
             else:
                 # Add to current section content
-                if line:  # Skip empty lines
-                    current_content.append(line)
+                current_content.append(line)
         
         # Add final section
         if current_section and current_content:
             current_section.content = '\n'.join(current_content).strip()
-            sections.append(current_section)
+            yield current_section
+            found_section = True
         
         # If no sections found, create a single section with all content
-        if not sections and text.strip():
-            sections.append(DocumentSection(
-                title="Document Content",
-                content=text.strip(),
-                page_number=1
-            ))
-        
-        logger.info(f"Extracted {len(sections)} sections")
-        return sections
+        if not found_section:
+            fallback_text = '\n'.join(page_text for page_text in page_texts if page_text).strip()
+            if fallback_text:
+                yield DocumentSection(
+                    title="Document Content",
+                    content=fallback_text,
+                    page_number=1
+                )
     
     def _is_section_header(self, line: str) -> Optional[str]:
         """
@@ -209,13 +298,12 @@ class DocumentProcessor:
         if len(line) < 3 or len(line) > 200:
             return None
         
-        for pattern in self.section_patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                if len(match.groups()) >= 2:
-                    return match.group(2).strip()
-                else:
-                    return line.strip()
+        match = self.section_header_pattern.match(line)
+        if match:
+            title = match.group('numbered_title') or match.group('roman_title')
+            if title is not None:
+                return title.strip()
+            return line.strip()
         
         # Check for other header indicators
         if (line.isupper() and len(line.split()) <= 8 and 
@@ -235,12 +323,12 @@ class DocumentProcessor:
             Section number or None
         """
         # Look for numbers at the beginning
-        match = re.match(r'^(\d+\.?\d*\.?\d*)', title)
+        match = self.section_number_pattern.match(title)
         if match:
             return match.group(1)
         
         # Look for roman numerals
-        match = re.match(r'^([IVX]+)', title)
+        match = self.roman_number_pattern.match(title)
         if match:
             return match.group(1)
         
@@ -2,10 +2,20 @@
 Output formatter for generating structured JSON results.
 """
 
+import dataclasses
 import json
 import logging
+import os
+import tempfile
+import uuid
 from datetime import datetime
-from typing import Dict, List, Any
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from document_processor import ProcessedDocument
 from relevance_scorer import ScoredSection, SubSection
@@ -13,6 +23,141 @@ from relevance_scorer import ScoredSection, SubSection
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Convert numpy values and dataclasses for the stdlib JSON encoder."""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def serialize_output(output_data: Dict[str, Any], indent: bool = True) -> bytes:
+    """
+    Serialize output data to UTF-8 JSON bytes.
+    
+    Uses orjson when installed and falls back to the stdlib encoder.
+    
+    Args:
+        output_data: Formatted output data
+        indent: Pretty-print with two-space indentation; compact single-line JSON when False
+    
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(output_data, option=option)
+    if indent:
+        return json.dumps(
+            output_data, indent=2, ensure_ascii=False, default=_json_default
+        ).encode('utf-8')
+    return json.dumps(
+        output_data, separators=(',', ':'), ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+# Permission bits a plain open() gives new files, read lazily on first use
+_new_file_mode = None
+
+
+def _get_new_file_mode(directory: Path) -> int:
+    """
+    Get the permission bits the process umask gives newly created files.
+    
+    The umask is read once, from /proc on Linux or otherwise by creating a
+    probe file, and never by toggling the process-wide umask.
+    
+    Args:
+        directory: Writable directory to probe in when /proc is unavailable
+    
+    Returns:
+        Mode bits for a new file
+    """
+    global _new_file_mode
+    if _new_file_mode is None:
+        try:
+            with open('/proc/self/status') as f:
+                umask = next(int(line.split()[1], 8) for line in f if line.startswith('Umask:'))
+            _new_file_mode = 0o666 & ~umask
+        except (OSError, StopIteration, ValueError, IndexError):
+            probe_path = os.path.join(directory, f".umask-probe-{uuid.uuid4().hex}")
+            fd = os.open(probe_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                _new_file_mode = os.fstat(fd).st_mode & 0o777
+            finally:
+                os.close(fd)
+                os.remove(probe_path)
+    return _new_file_mode
+
+
+def _atomic_write_bytes(target: Path, payload: bytes) -> None:
+    """
+    Write bytes to a unique sibling temporary file and rename it over the target.
+    
+    Concurrent writers never share a temporary file, and the temporary file
+    is removed if writing or renaming fails. The result keeps the mode of an
+    existing target, or gets the usual umask-based mode for a new one.
+    
+    Args:
+        target: Destination file path
+        payload: Encoded file contents
+    """
+    try:
+        mode = os.stat(target).st_mode & 0o777
+    except FileNotFoundError:
+        mode = _get_new_file_mode(target.parent)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix='.tmp')
+    try:
+        # mkstemp creates owner-only files; match what a plain open() would give
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, mode)
+        else:
+            os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_output(output_data: Dict[str, Any], filepath: str, indent: bool = True) -> None:
+    """
+    Atomically write output data as JSON.
+    
+    The document is encoded first, then written to a unique sibling temporary
+    file in a single call and renamed over the target, so readers never
+    observe a partially written file.
+    
+    Args:
+        output_data: Formatted output data
+        filepath: Path to save the JSON file
+        indent: Pretty-print for human readers; write compact JSON when False
+    """
+    _atomic_write_bytes(Path(filepath), serialize_output(output_data, indent=indent))
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], filepath: str) -> None:
+    """
+    Atomically write several output documents as newline-delimited JSON.
+    
+    Each document is encoded compactly on its own line. The whole payload is
+    written to a unique sibling temporary file in a single call, which is
+    then renamed over the target.
+    
+    Args:
+        records: Formatted output documents, in order
+        filepath: Path to save the NDJSON file
+    """
+    payload = b''.join(serialize_output(record, indent=False) + b'\n' for record in records)
+    _atomic_write_bytes(Path(filepath), payload)
+
+
 class OutputFormatter:
     """Formats analysis results into the required JSON structure."""
     
@@ -41,6 +186,9 @@ class OutputFormatter:
         """
         logger.info("Formatting output JSON")
         
+        # Count sections per document once for the statistics below
+        section_counts = [len(doc.sections) for doc in documents]
+        
         # Build metadata
         metadata = {
             "input_documents": [doc.filename for doc in documents],
@@ -49,14 +197,16 @@ class OutputFormatter:
             "processing_timestamp": datetime.now().isoformat(),
             "processing_time_seconds": round(processing_time, 2),
             "total_documents_processed": len(documents),
-            "total_sections_analyzed": sum(len(doc.sections) for doc in documents),
+            "total_sections_analyzed": sum(section_counts),
             "top_sections_selected": len(sections),
             "subsections_extracted": len(subsections)
         }
         
         # Format extracted sections
         extracted_sections = []
+        total_relevance = 0
         for scored_section in sections:
+            total_relevance += scored_section.relevance_score
             section_data = {
                 "document": scored_section.document,
                 "page_number": scored_section.section.page_number,
@@ -91,7 +241,7 @@ class OutputFormatter:
                 "top_sections_count": len(extracted_sections),
                 "subsections_count": len(subsection_analysis),
                 "avg_section_relevance": round(
-                    sum(s.relevance_score for s in sections) / len(sections) if sections else 0, 4
+                    total_relevance / len(extracted_sections) if extracted_sections else 0, 4
                 ),
                 "processing_performance": {
                     "within_time_constraint": processing_time <= 60,
@@ -117,14 +267,12 @@ class OutputFormatter:
         if len(content) <= max_length:
             return content
         
-        # Find the last complete word within the limit
-        truncated = content[:max_length]
-        last_space = truncated.rfind(' ')
-        
-        if last_space > max_length * 0.8:  # If we can preserve most of the content
-            truncated = truncated[:last_space]
+        # Find the last complete word within the limit, looking only where it
+        # would preserve most of the content
+        last_space = content.rfind(' ', int(max_length * 0.8) + 1, max_length)
+        end = last_space if last_space != -1 else max_length
         
-        return truncated + "..."
+        return content[:end] + "..."
     
     def save_output(self, output_data: Dict[str, Any], filepath: str) -> bool:
         """
@@ -138,8 +286,7 @@ class OutputFormatter:
             True if successful, False otherwise
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            write_output(output_data, filepath)
             logger.info(f"Output saved to {filepath}")
             return True
         except Exception as e:
@@ -4,11 +4,29 @@ Persona analyzer for understanding user roles, expertise, and job requirements.
 
 import logging
 import re
-from typing import Dict, List, Set
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from _cache import disk_memoize, memoize
+
 logger = logging.getLogger(__name__)
 
+# Common words dropped from persona and job keywords
+_STOP_WORDS_PERSONA = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one',
+    'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see',
+    'two', 'way', 'who', 'its', 'said', 'each', 'make', 'most', 'over', 'such', 'very', 'what',
+    'with'
+})
+_STOP_WORDS_JOB = _STOP_WORDS_PERSONA | {'given', 'that', 'this', 'should', 'will', 'from'}
+
 
 @dataclass
 class PersonaProfile:
@@ -33,8 +51,14 @@ class JobRequirements:
 class PersonaAnalyzer:
     """Analyzes persona descriptions and job requirements."""
     
-    def __init__(self):
-        """Initialize the persona analyzer."""
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the persona analyzer.
+        
+        Args:
+            cache_dir: Directory for persisting analysis results across runs;
+                results are only cached in memory when None
+        """
         # Domain knowledge mappings
         self.domain_keywords = {
             'computer_science': ['algorithm', 'programming', 'software', 'computing', 'data structure', 'AI', 'ML', 'neural network'],
@@ -64,7 +88,64 @@ class PersonaAnalyzer:
             'identification': ['identify', 'find', 'locate', 'extract', 'select'],
             'learning': ['learn', 'study', 'understand', 'master', 'practice']
         }
+        
+        # Single automaton over all indicator keywords, tagged by mapping and category
+        self._keyword_automaton = None
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for kind, mapping in (('domain', self.domain_keywords),
+                                  ('skill', self.skill_indicators),
+                                  ('job', self.job_types)):
+                for category, keywords in mapping.items():
+                    for keyword in keywords:
+                        tags = self._keyword_automaton.get(keyword, set())
+                        tags.add((kind, category))
+                        self._keyword_automaton.add_word(keyword, tags)
+            self._keyword_automaton.make_automaton()
+        
+        # Precompiled patterns for role, domain, focus and need extraction, each
+        # paired with the literal trigger words it cannot match without
+        self.role_patterns = [
+            (re.compile(r'(PhD\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Researcher|Student|Analyst|Manager|Director)', re.IGNORECASE),
+             {'research', 'student', 'analyst', 'manager', 'director'}),
+            (re.compile(r'(Undergraduate|Graduate)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+Student', re.IGNORECASE),
+             {'student'}),
+            (re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Analyst|Researcher|Scientist|Engineer|Manager)', re.IGNORECASE),
+             {'analyst', 'research', 'scientist', 'engineer', 'manager'})
+        ]
+        self.domain_patterns = [
+            (re.compile(r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'), {'in'}),
+            (re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:research|studies|field)'), {'research', 'studies', 'field'}),
+        ]
+        self.focus_patterns = [
+            (re.compile(r'focus(?:ing|es)?\s+on\s+([^,.]+)', re.IGNORECASE), {'focus'}),
+            (re.compile(r'specializ(?:ing|es)?\s+in\s+([^,.]+)', re.IGNORECASE), {'specializ'}),
+            (re.compile(r'expert(?:ise)?\s+in\s+([^,.]+)', re.IGNORECASE), {'expert'}),
+            (re.compile(r'working\s+(?:on|with)\s+([^,.]+)', re.IGNORECASE), {'working'})
+        ]
+        self.need_patterns = [
+            (re.compile(r'focus(?:ing|es)?\s+on\s+([^,.]+)', re.IGNORECASE), {'focus'}),
+            (re.compile(r'includ(?:ing|es)?\s+([^,.]+)', re.IGNORECASE), {'includ'}),
+            (re.compile(r'such\s+as\s+([^,.]+)', re.IGNORECASE), {'such'}),
+            (re.compile(r'(?:about|regarding|concerning)\s+([^,.]+)', re.IGNORECASE), {'about', 'regarding', 'concerning'})
+        ]
+        
+        # One lookahead scan finds every trigger word, overlapping or not
+        self.pattern_trigger = re.compile(
+            r'(?=(focus|specializ|expert|working|includ|such|about|regarding|concerning'
+            r'|research|student|analyst|manager|director|scientist|engineer|studies|field|in(?=\s)))',
+            re.IGNORECASE
+        )
+        self.primary_goal_pattern = re.compile(r'^([A-Z][a-z]+(?:\s+[a-z]+)*)')
+        self.word_pattern = re.compile(r'\b[a-zA-Z]{3,}\b')
+        
+        # In-memory LRU caches for repeated persona and job descriptions
+        self._persona_cache = OrderedDict()
+        self._job_cache = OrderedDict()
+        self._disk_cache_dir = Path(cache_dir) if cache_dir else None
     
+    @memoize('_persona_cache')
+    @disk_memoize('_disk_cache_dir')
     def analyze_persona(self, persona_description: str) -> PersonaProfile:
         """
         Analyze persona description to extract profile information.
@@ -77,20 +158,24 @@ class PersonaAnalyzer:
         """
         logger.info(f"Analyzing persona: {persona_description}")
         
+        # Find which extraction patterns can match, in one scan
+        triggers = self._find_pattern_triggers(persona_description)
+        description_lower = persona_description.lower()
+        
         # Extract role
-        role = self._extract_role(persona_description)
+        role = self._extract_role(persona_description, triggers)
         
         # Determine skill level
-        skill_level = self._determine_skill_level(persona_description)
+        skill_level = self._determine_skill_level(description_lower)
         
         # Extract expertise domains
-        expertise_domains = self._extract_expertise_domains(persona_description)
+        expertise_domains = self._extract_expertise_domains(persona_description, description_lower, triggers)
         
         # Extract focus areas
-        focus_areas = self._extract_focus_areas(persona_description)
+        focus_areas = self._extract_focus_areas(persona_description, triggers)
         
         # Generate relevant keywords
-        keywords = self._generate_persona_keywords(persona_description, expertise_domains)
+        keywords = self._generate_persona_keywords(description_lower, expertise_domains)
         
         return PersonaProfile(
             role=role,
@@ -100,6 +185,8 @@ class PersonaAnalyzer:
             keywords=keywords
         )
     
+    @memoize('_job_cache')
+    @disk_memoize('_disk_cache_dir')
     def analyze_job(self, job_description: str) -> JobRequirements:
         """
         Analyze job-to-be-done description.
@@ -111,21 +198,24 @@ class PersonaAnalyzer:
             JobRequirements object
         """
         logger.info(f"Analyzing job: {job_description}")
+        description_lower = job_description.lower()
         
         # Extract primary goal
         primary_goal = self._extract_primary_goal(job_description)
         
         # Extract information needs
-        information_needs = self._extract_information_needs(job_description)
+        information_needs = self._extract_information_needs(
+            job_description, self._find_pattern_triggers(job_description)
+        )
         
         # Determine deliverable type
-        deliverable_type = self._determine_deliverable_type(job_description)
+        deliverable_type = self._determine_deliverable_type(description_lower)
         
         # Extract priority keywords
-        priority_keywords = self._extract_priority_keywords(job_description)
+        priority_keywords = self._extract_priority_keywords(description_lower)
         
         # Define success criteria
-        success_criteria = self._define_success_criteria(job_description)
+        success_criteria = self._define_success_criteria(description_lower)
         
         return JobRequirements(
             primary_goal=primary_goal,
@@ -135,17 +225,90 @@ class PersonaAnalyzer:
             success_criteria=success_criteria
         )
     
-    def _extract_role(self, description: str) -> str:
-        """Extract the primary role from persona description."""
-        # Look for explicit role indicators
-        role_patterns = [
-            r'(PhD\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Researcher|Student|Analyst|Manager|Director)',
-            r'(Undergraduate|Graduate)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+Student',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Analyst|Researcher|Scientist|Engineer|Manager)'
+    def analyze_persona_batch(self, persona_descriptions: List[str]) -> List[PersonaProfile]:
+        """
+        Analyze several persona descriptions in one call.
+        
+        Identical descriptions are analyzed only once.
+        
+        Args:
+            persona_descriptions: Text descriptions of the personas
+        
+        Returns:
+            PersonaProfile objects in input order
+        """
+        profiles = {text: self.analyze_persona(text) for text in dict.fromkeys(persona_descriptions)}
+        return [profiles[text] for text in persona_descriptions]
+    
+    def analyze_job_batch(self, job_descriptions: List[str]) -> List[JobRequirements]:
+        """
+        Analyze several job-to-be-done descriptions in one call.
+        
+        Identical descriptions are analyzed only once.
+        
+        Args:
+            job_descriptions: Text descriptions of the jobs/tasks
+        
+        Returns:
+            JobRequirements objects in input order
+        """
+        requirements = {text: self.analyze_job(text) for text in dict.fromkeys(job_descriptions)}
+        return [requirements[text] for text in job_descriptions]
+    
+    def _match_keyword_categories(self, text_lower: str, kind: str, mapping: Dict[str, List[str]]) -> List[str]:
+        """
+        Find which categories of a keyword mapping occur in lowercased text.
+        
+        Args:
+            text_lower: Lowercased text to scan
+            kind: Mapping tag used in the keyword automaton
+            mapping: Category to keywords mapping to fall back on
+        
+        Returns:
+            Matching categories in mapping order
+        """
+        if self._keyword_automaton is not None:
+            hits = set()
+            for _, tags in self._keyword_automaton.iter(text_lower):
+                hits.update(category for tag_kind, category in tags if tag_kind == kind)
+            return [category for category in mapping if category in hits]
+        
+        return [
+            category for category, keywords in mapping.items()
+            if any(keyword in text_lower for keyword in keywords)
         ]
+    
+    def _find_pattern_triggers(self, text: str) -> Set[str]:
+        """
+        Find the trigger words present in text with a single scan.
+        
+        Args:
+            text: Persona or job description
+        
+        Returns:
+            Lowercased trigger words found in the text
+        """
+        return {match.group(1).lower() for match in self.pattern_trigger.finditer(text)}
+    
+    def _candidate_patterns(self, patterns: List[Tuple[re.Pattern, Set[str]]],
+                            triggers: Set[str]) -> List[re.Pattern]:
+        """
+        Select the patterns whose trigger words occur in the text.
         
-        for pattern in role_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        Args:
+            patterns: (compiled pattern, trigger words) pairs in priority order
+            triggers: Trigger words found by _find_pattern_triggers
+        
+        Returns:
+            Compiled patterns that can possibly match, in priority order
+        """
+        return [pattern for pattern, required in patterns if not required.isdisjoint(triggers)]
+    
+    def _extract_role(self, description: str, triggers: Set[str]) -> str:
+        """Extract the primary role from persona description."""
+        # Look for explicit role indicators
+        for pattern in self._candidate_patterns(self.role_patterns, triggers):
+            match = pattern.search(description)
             if match:
                 return match.group(0).strip()
         
@@ -156,33 +319,21 @@ class PersonaAnalyzer:
         
         return description.strip()
     
-    def _determine_skill_level(self, description: str) -> str:
-        """Determine skill level from persona description."""
-        description_lower = description.lower()
-        
-        for level, indicators in self.skill_indicators.items():
-            if any(indicator in description_lower for indicator in indicators):
-                return level
+    def _determine_skill_level(self, description_lower: str) -> str:
+        """Determine skill level from lowercased persona description."""
+        levels = self._match_keyword_categories(description_lower, 'skill', self.skill_indicators)
+        if levels:
+            return levels[0]
         
         return 'intermediate'  # Default
     
-    def _extract_expertise_domains(self, description: str) -> List[str]:
+    def _extract_expertise_domains(self, description: str, description_lower: str, triggers: Set[str]) -> List[str]:
         """Extract expertise domains from persona description."""
-        domains = []
-        description_lower = description.lower()
-        
-        for domain, keywords in self.domain_keywords.items():
-            if any(keyword in description_lower for keyword in keywords):
-                domains.append(domain)
+        domains = self._match_keyword_categories(description_lower, 'domain', self.domain_keywords)
         
         # Also look for explicit domain mentions
-        domain_patterns = [
-            r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:research|studies|field)',
-        ]
-        
-        for pattern in domain_patterns:
-            matches = re.findall(pattern, description)
+        for pattern in self._candidate_patterns(self.domain_patterns, triggers):
+            matches = pattern.findall(description)
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0] if match[0] else match[1]
@@ -190,30 +341,23 @@ class PersonaAnalyzer:
         
         return list(set(domains))
     
-    def _extract_focus_areas(self, description: str) -> List[str]:
+    def _extract_focus_areas(self, description: str, triggers: Set[str]) -> List[str]:
         """Extract specific focus areas from persona description."""
         focus_areas = []
         
         # Look for "focusing on", "specializing in", etc.
-        focus_patterns = [
-            r'focus(?:ing|es)?\s+on\s+([^,.]+)',
-            r'specializ(?:ing|es)?\s+in\s+([^,.]+)',
-            r'expert(?:ise)?\s+in\s+([^,.]+)',
-            r'working\s+(?:on|with)\s+([^,.]+)'
-        ]
-        
-        for pattern in focus_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
+        for pattern in self._candidate_patterns(self.focus_patterns, triggers):
+            matches = pattern.findall(description)
             focus_areas.extend([match.strip() for match in matches])
         
         return focus_areas
     
-    def _generate_persona_keywords(self, description: str, domains: List[str]) -> Set[str]:
-        """Generate relevant keywords for the persona."""
+    def _generate_persona_keywords(self, description_lower: str, domains: List[str]) -> Set[str]:
+        """Generate relevant keywords for the lowercased persona description."""
         keywords = set()
         
         # Add words from description
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', description.lower())
+        words = self.word_pattern.findall(description_lower)
         keywords.update(words)
         
         # Add domain-specific keywords
@@ -222,77 +366,66 @@ class PersonaAnalyzer:
                 keywords.update(self.domain_keywords[domain])
         
         # Remove common stop words
-        stop_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'its', 'said', 'each', 'make', 'most', 'over', 'such', 'very', 'what', 'with'}
-        keywords = keywords - stop_words
+        keywords -= _STOP_WORDS_PERSONA
         
         return keywords
     
     def _extract_primary_goal(self, job_description: str) -> str:
         """Extract the primary goal from job description."""
         # Look for action verbs at the beginning
-        action_match = re.match(r'^([A-Z][a-z]+(?:\s+[a-z]+)*)', job_description)
+        action_match = self.primary_goal_pattern.match(job_description)
         if action_match:
             return action_match.group(1)
         
         return job_description.split('.')[0].strip()
     
-    def _extract_information_needs(self, job_description: str) -> List[str]:
+    def _extract_information_needs(self, job_description: str, triggers: Set[str]) -> List[str]:
         """Extract specific information needs from job description."""
         needs = []
         
         # Look for "focusing on", "including", etc.
-        need_patterns = [
-            r'focus(?:ing|es)?\s+on\s+([^,.]+)',
-            r'includ(?:ing|es)?\s+([^,.]+)',
-            r'such\s+as\s+([^,.]+)',
-            r'(?:about|regarding|concerning)\s+([^,.]+)'
-        ]
-        
-        for pattern in need_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+        for pattern in self._candidate_patterns(self.need_patterns, triggers):
+            matches = pattern.findall(job_description)
             needs.extend([match.strip() for match in matches])
         
         return needs
     
-    def _determine_deliverable_type(self, job_description: str) -> str:
-        """Determine the type of deliverable expected."""
-        description_lower = job_description.lower()
-        
-        for job_type, indicators in self.job_types.items():
-            if any(indicator in description_lower for indicator in indicators):
-                return job_type
+    def _determine_deliverable_type(self, description_lower: str) -> str:
+        """Determine the type of deliverable expected from lowercased job description."""
+        job_types = self._match_keyword_categories(description_lower, 'job', self.job_types)
+        if job_types:
+            return job_types[0]
         
         return 'analysis'  # Default
     
-    def _extract_priority_keywords(self, job_description: str) -> Set[str]:
-        """Extract priority keywords from job description."""
+    def _extract_priority_keywords(self, description_lower: str) -> Set[str]:
+        """Extract priority keywords from lowercased job description."""
         keywords = set()
         
         # Extract all meaningful words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', job_description.lower())
+        words = self.word_pattern.findall(description_lower)
         keywords.update(words)
         
         # Remove common words
-        stop_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'its', 'said', 'each', 'make', 'most', 'over', 'such', 'very', 'what', 'with', 'given', 'that', 'this', 'should', 'will', 'from'}
-        keywords = keywords - stop_words
+        keywords -= _STOP_WORDS_JOB
         
         return keywords
     
-    def _define_success_criteria(self, job_description: str) -> List[str]:
-        """Define success criteria based on job description."""
+    def _define_success_criteria(self, description_lower: str) -> List[str]:
+        """Define success criteria based on lowercased job description."""
         criteria = []
         
         # Extract explicit criteria
-        if 'comprehensive' in job_description.lower():
+        if 'comprehensive' in description_lower:
             criteria.append('Comprehensive coverage of topic')
         
-        if any(word in job_description.lower() for word in ['methodology', 'method']):
+        if any(word in description_lower for word in ['methodology', 'method']):
             criteria.append('Clear methodology explanation')
         
-        if any(word in job_description.lower() for word in ['performance', 'benchmark', 'result']):
+        if any(word in description_lower for word in ['performance', 'benchmark', 'result']):
             criteria.append('Performance metrics and results')
         
-        if any(word in job_description.lower() for word in ['trend', 'analysis', 'compare']):
+        if any(word in description_lower for word in ['trend', 'analysis', 'compare']):
             criteria.append('Trend analysis and comparisons')
         
         # Default criteria
@@ -0,0 +1,98 @@
+"""
+End-to-end analysis pipeline shared by the command-line entry points.
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+from _cache import user_cache_dir
+from document_processor import DocumentProcessor
+from persona_analyzer import PersonaAnalyzer
+from relevance_scorer import RelevanceScorer
+from output_formatter import OutputFormatter, write_output
+
+logger = logging.getLogger(__name__)
+
+
+def run(
+    documents: str,
+    persona: str,
+    job: str,
+    output: str,
+    max_sections: int = 10,
+    max_subsections: int = 5,
+    cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Run the full pipeline and save the result as JSON.
+    
+    Args:
+        documents: Path to PDF file or directory containing PDFs
+        persona: Persona description
+        job: Job-to-be-done description
+        output: Output JSON file path
+        max_sections: Maximum number of sections to extract
+        max_subsections: Maximum number of sub-sections per section
+        cache: Persist persona/job analysis results in the per-user cache directory
+    
+    Returns:
+        Formatted output dictionary
+    """
+    start_time = time.time()
+    
+    # Initialize components
+    logger.info("Initializing document processing components...")
+    document_processor = DocumentProcessor()
+    persona_analyzer = PersonaAnalyzer(cache_dir=user_cache_dir('persona') if cache else None)
+    relevance_scorer = RelevanceScorer()
+    output_formatter = OutputFormatter()
+    
+    # Process documents
+    logger.info(f"Processing documents from: {documents}")
+    # Only filenames, pages and sections reach the output, so skip PDF metadata
+    processed_documents = document_processor.process_documents(documents, load_metadata=False)
+    
+    if not processed_documents:
+        raise ValueError("No documents found or processed successfully")
+    
+    # Analyze persona and job
+    logger.info("Analyzing persona and job requirements...")
+    persona_profile = persona_analyzer.analyze_persona(persona)
+    job_requirements = persona_analyzer.analyze_job(job)
+    
+    # Score and rank sections
+    logger.info("Scoring document sections for relevance...")
+    ranked_sections = relevance_scorer.score_sections(
+        processed_documents, persona_profile, job_requirements, max_sections
+    )
+    
+    # Extract sub-sections
+    logger.info("Extracting relevant sub-sections...")
+    sub_sections = relevance_scorer.extract_subsections(
+        ranked_sections, persona_profile, job_requirements, max_subsections
+    )
+    
+    # Format output
+    logger.info("Formatting output...")
+    output_data = output_formatter.format_output(
+        documents=processed_documents,
+        persona=persona,
+        job=job,
+        sections=ranked_sections,
+        subsections=sub_sections,
+        processing_time=time.time() - start_time
+    )
+    
+    # Save output
+    write_output(output_data, output)
+    
+    processing_time = time.time() - start_time
+    logger.info(f"Processing completed in {processing_time:.2f} seconds")
+    logger.info(f"Output saved to: {output}")
+    
+    # Validate processing time constraint
+    if processing_time > 60:
+        logger.warning(f"Processing time ({processing_time:.2f}s) exceeded 60-second constraint")
+    
+    return output_data
@@ -2,22 +2,135 @@
 Relevance scorer for ranking document sections based on persona and job requirements.
 """
 
+import functools
+import heapq
 import logging
 import math
 import re
-from typing import Dict, List, Tuple, Set
-from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Set
+from dataclasses import dataclass, field
 from collections import Counter
 
 import numpy as np
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from document_processor import DocumentSection, ProcessedDocument
 from persona_analyzer import PersonaProfile, JobRequirements
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries and whitespace runs used when extracting sub-sections
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Keywords that signal content from each persona expertise domain
+_DOMAIN_KEYWORDS = {
+    'computer_science': ['algorithm', 'programming', 'software', 'computing', 'data', 'neural', 'machine'],
+    'biology': ['gene', 'protein', 'cell', 'organism', 'molecular', 'genetic'],
+    'chemistry': ['reaction', 'compound', 'molecule', 'synthesis', 'organic', 'kinetics'],
+    'finance': ['revenue', 'profit', 'investment', 'market', 'financial'],
+    'medicine': ['patient', 'treatment', 'clinical', 'therapeutic', 'medical'],
+    'research': ['study', 'analysis', 'methodology', 'experiment', 'literature'],
+    'education': ['learning', 'curriculum', 'academic', 'study'],
+    'business': ['strategy', 'management', 'operations', 'marketing']
+}
+
+# Section title terms that mark structurally important sections
+_HIGH_VALUE_TERMS = frozenset({
+    'abstract', 'introduction', 'conclusion', 'summary', 'results',
+    'methodology', 'methods', 'discussion', 'findings', 'analysis'
+})
+
+# Content terms preferred for expert and beginner personas
+_TECHNICAL_TERMS = frozenset({'methodology', 'analysis', 'framework', 'model', 'algorithm'})
+_INTRO_TERMS = frozenset({'introduction', 'overview', 'basic', 'fundamental', 'concept'})
+
+# Content terms that match each deliverable type
+_DELIVERABLE_KEYWORDS = {
+    'analysis': frozenset({'analysis', 'analyze', 'examination', 'evaluation'}),
+    'synthesis': frozenset({'summary', 'overview', 'compilation', 'integration'}),
+    'review': frozenset({'review', 'survey', 'literature', 'comprehensive'}),
+    'preparation': frozenset({'methodology', 'approach', 'framework', 'procedure'}),
+    'identification': frozenset({'key', 'important', 'significant', 'main'}),
+    'learning': frozenset({'concept', 'principle', 'fundamental', 'theory'})
+}
+
+# Sentence terms that suggest substantive sub-section content
+_QUALITY_INDICATORS = frozenset({'result', 'finding', 'conclusion', 'analysis', 'method', 'approach'})
+
+
+@functools.lru_cache(maxsize=32)
+def _build_keyword_automaton(keywords: FrozenSet[str]) -> Optional['ahocorasick.Automaton']:
+    """
+    Build an Aho-Corasick automaton that reports which keywords occur in a text.
+    
+    Args:
+        keywords: Keywords to match
+    
+    Returns:
+        Automaton mapping each keyword to itself, or None when pyahocorasick is
+        not installed or the keywords cannot be matched by it (empty set or
+        empty string)
+    """
+    if ahocorasick is None or not keywords or '' in keywords:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, best first.
+    
+    Equal scores keep their original order, as with a stable descending sort,
+    but only the k selected entries are sorted.
+    
+    Args:
+        scores: One score per item
+        k: Number of indices to return
+    
+    Returns:
+        Indices of the top-k scores in rank order
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    if k < len(scores):
+        # Find the k-th highest score, then keep everything above it plus the
+        # earliest entries tied with it
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:k - len(above)]
+        candidates = np.sort(np.concatenate([above, tied]))
+    else:
+        candidates = np.arange(len(scores))
+    
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+@dataclass
+class SectionFeatures:
+    """Query-independent section data, reusable across persona/job pairs."""
+    sections: List[Tuple[str, DocumentSection]]
+    corpus: Tuple[str, ...]
+    lowered_contents: List[str]
+    lowered_titles: List[str]
+    content_word_counts: np.ndarray
+    section_rows: np.ndarray
+    tfidf_vectorizer: Optional[TfidfVectorizer]
+    tfidf_matrix: Optional[Any]
+    query_scores: Dict[str, np.ndarray] = field(default_factory=dict)
+
 
 @dataclass
 class ScoredSection:
@@ -45,12 +158,14 @@ class RelevanceScorer:
     
     def __init__(self):
         """Initialize the relevance scorer."""
+        # Template vectorizer; each corpus is fitted on its own clone
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=1000,
             stop_words='english',
             ngram_range=(1, 2),
             min_df=1,
-            max_df=0.95
+            max_df=0.95,
+            dtype=np.float32
         )
         
         # Weights for different scoring components
@@ -61,13 +176,93 @@ class RelevanceScorer:
             'persona_alignment': 0.15,
             'job_alignment': 0.15
         }
+        
+        # Features of the last corpus; their TF-IDF fit and per-query
+        # similarities are reused while repeated calls score the same sections
+        self._features = None
+    
+    def precompute_document_features(self, documents: List[ProcessedDocument]) -> SectionFeatures:
+        """
+        Precompute the query-independent features of every section.
+        
+        Pass the result to score_sections to score several persona/job pairs
+        against the same documents without repeating this work.
+        
+        Args:
+            documents: List of processed documents
+        
+        Returns:
+            Section features for the documents
+        """
+        # Collect all sections from all documents
+        all_sections = []
+        for doc in documents:
+            for section in doc.sections:
+                all_sections.append((doc.filename, section))
+        
+        section_texts = [section.content for _, section in all_sections]
+        corpus = tuple(section_texts)
+        
+        # Identical section bodies (boilerplate, repeated references) are
+        # processed once; section_rows maps each section to its unique body
+        unique_rows = {}
+        section_rows = np.array(
+            [unique_rows.setdefault(text, len(unique_rows)) for text in section_texts], dtype=np.intp
+        )
+        unique_texts = list(unique_rows)
+        lowered_unique = [text.lower() for text in unique_texts]
+        
+        # Refit only when the corpus differs from the previous call
+        previous = self._features
+        if previous is not None and previous.corpus == corpus:
+            tfidf_vectorizer = previous.tfidf_vectorizer
+            tfidf_matrix = previous.tfidf_matrix
+            query_scores = previous.query_scores
+        else:
+            tfidf_vectorizer, tfidf_matrix = self._fit_tfidf(unique_texts, section_rows)
+            query_scores = {}
+        
+        self._features = SectionFeatures(
+            sections=all_sections,
+            corpus=corpus,
+            lowered_contents=[lowered_unique[row] for row in section_rows],
+            lowered_titles=[section.title.lower() for _, section in all_sections],
+            content_word_counts=np.array([len(text.split()) for text in unique_texts], dtype=int)[section_rows],
+            section_rows=section_rows,
+            tfidf_vectorizer=tfidf_vectorizer,
+            tfidf_matrix=tfidf_matrix,
+            query_scores=query_scores
+        )
+        return self._features
+    
+    def _fit_tfidf(
+        self,
+        unique_texts: List[str],
+        section_rows: np.ndarray
+    ) -> Tuple[Optional[TfidfVectorizer], Optional[Any]]:
+        """Fit TF-IDF weights for a corpus, returning None on failure."""
+        if not unique_texts:
+            return None, None
+        
+        try:
+            # Fit on every section so duplicates still count towards the
+            # document frequencies and vocabulary limits, but keep one row
+            # per unique body (duplicate bodies have identical rows)
+            tfidf_vectorizer = clone(self.tfidf_vectorizer)
+            section_matrix = tfidf_vectorizer.fit_transform([unique_texts[row] for row in section_rows])
+            first_rows = np.unique(section_rows, return_index=True)[1]
+            return tfidf_vectorizer, section_matrix[first_rows]
+        except Exception as e:
+            logger.warning(f"TF-IDF failed, using simpler scoring: {e}")
+            return None, None
     
     def score_sections(
         self, 
         documents: List[ProcessedDocument], 
         persona: PersonaProfile, 
         job: JobRequirements,
-        max_sections: int = 10
+        max_sections: int = 10,
+        precomputed: Optional[SectionFeatures] = None
     ) -> List[ScoredSection]:
         """
         Score and rank document sections for relevance.
@@ -77,68 +272,82 @@ class RelevanceScorer:
             persona: User persona profile
             job: Job requirements
             max_sections: Maximum number of sections to return
+            precomputed: Features from precompute_document_features for the
+                same documents; computed here when omitted
             
         Returns:
             List of scored sections ranked by relevance
         """
         logger.info(f"Scoring sections for {len(documents)} documents")
         
-        all_sections = []
-        
-        # Collect all sections from all documents
-        for doc in documents:
-            for section in doc.sections:
-                all_sections.append((doc.filename, section))
+        features = precomputed if precomputed is not None else self.precompute_document_features(documents)
+        all_sections = features.sections
         
         if not all_sections:
             logger.warning("No sections found in documents")
             return []
         
-        # Prepare text corpus for TF-IDF
-        section_texts = [section.content for _, section in all_sections]
+        # Combine persona and job keywords once for all sections
+        all_keywords = self._merge_keywords(persona, job)
         
-        try:
-            # Fit TF-IDF vectorizer
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(section_texts)
-        except Exception as e:
-            logger.warning(f"TF-IDF failed, using simpler scoring: {e}")
-            tfidf_matrix = None
+        # Collect every term the scoring helpers test for, so each section's
+        # content and title are scanned only once
+        probe_terms = self._collect_probe_terms(persona, job, all_keywords)
         
-        scored_sections = []
+        # Score every section against the persona/job query in one batch,
+        # skipping the query entirely when TF-IDF is unavailable
+        if features.tfidf_matrix is None:
+            semantic_scores = np.zeros(len(all_sections))
+        else:
+            semantic_scores = self._calculate_semantic_scores(persona, job, features)[features.section_rows]
         
-        for i, (doc_name, section) in enumerate(all_sections):
-            # Calculate component scores
-            keyword_score = self._calculate_keyword_score(section, persona, job)
-            semantic_score = self._calculate_semantic_score(section, persona, job, tfidf_matrix, i)
-            structural_score = self._calculate_structural_score(section)
-            persona_alignment = self._calculate_persona_alignment(section, persona)
-            job_alignment = self._calculate_job_alignment(section, job)
-            
-            # Calculate weighted overall score
-            relevance_score = (
-                self.weights['keyword_match'] * keyword_score +
-                self.weights['semantic_similarity'] * semantic_score +
-                self.weights['structural_importance'] * structural_score +
-                self.weights['persona_alignment'] * persona_alignment +
-                self.weights['job_alignment'] * job_alignment
-            )
-            
+        # One row of component scores per section, columns in weight order
+        component_names = (
+            'keyword_match', 'semantic_similarity', 'structural_importance',
+            'persona_alignment', 'job_alignment'
+        )
+        component_scores = np.empty((len(all_sections), len(component_names)))
+        component_scores[:, 1] = semantic_scores
+        
+        # Keyword and alignment scores need each section's text
+        text_scores, high_value_titles = self._score_section_texts(
+            features.lowered_contents, features.lowered_titles,
+            all_keywords, probe_terms, persona, job
+        )
+        
+        # Normalize and clamp the raw text scores for all sections at once
+        component_scores[:, 0] = self._calculate_keyword_scores(
+            text_scores[:, 0], features.content_word_counts, len(all_keywords)
+        )
+        component_scores[:, 3:5] = np.minimum(text_scores[:, 1:], 1.0)
+        
+        # Structural scores only need per-section numbers, so compute them
+        # for all sections at once
+        component_scores[:, 2] = self._calculate_structural_scores(
+            [section for _, section in all_sections], high_value_titles, features.content_word_counts
+        )
+        
+        # Calculate weighted overall scores for all sections at once; adding the
+        # weighted columns in order matches the per-section formula exactly
+        relevance_scores = sum(
+            self.weights[name] * component_scores[:, j] for j, name in enumerate(component_names)
+        )
+        
+        # Select the top sections by relevance score and assign ranks
+        scored_sections = []
+        for rank, i in enumerate(_top_k_indices(relevance_scores, max_sections), 1):
+            doc_name, section = all_sections[i]
             scored_sections.append(ScoredSection(
                 document=doc_name,
                 section=section,
-                relevance_score=relevance_score,
-                persona_alignment=persona_alignment,
-                job_alignment=job_alignment,
-                importance_rank=0  # Will be set after sorting
+                relevance_score=float(relevance_scores[i]),
+                persona_alignment=float(component_scores[i, 3]),
+                job_alignment=float(component_scores[i, 4]),
+                importance_rank=rank
             ))
         
-        # Sort by relevance score and assign ranks
-        scored_sections.sort(key=lambda x: x.relevance_score, reverse=True)
-        for i, scored_section in enumerate(scored_sections[:max_sections], 1):
-            scored_section.importance_rank = i
-        
-        logger.info(f"Scored and ranked {len(scored_sections[:max_sections])} sections")
-        return scored_sections[:max_sections]
+        logger.info(f"Scored and ranked {len(scored_sections)} sections")
+        return scored_sections
     
     def extract_subsections(
         self,
@@ -161,11 +370,17 @@ class RelevanceScorer:
         """
         logger.info(f"Extracting sub-sections from {len(sections)} sections")
         
+        # Combine persona and job keywords once for all sentences, and scan
+        # each sentence for them and the quality indicators in one pass
+        all_keywords = self._merge_keywords(persona, job)
+        sentence_terms = all_keywords | _QUALITY_INDICATORS
+        sentence_automaton = _build_keyword_automaton(sentence_terms)
+        
         subsections = []
         
         for scored_section in sections:
             section_subsections = self._extract_section_subsections(
-                scored_section, persona, job, max_subsections
+                scored_section, all_keywords, sentence_terms, sentence_automaton, max_subsections
             )
             subsections.extend(section_subsections)
         
@@ -175,189 +390,257 @@ class RelevanceScorer:
         logger.info(f"Extracted {len(subsections)} sub-sections")
         return subsections
     
-    def _calculate_keyword_score(
-        self, 
-        section: DocumentSection, 
-        persona: PersonaProfile, 
+    def _merge_keywords(self, persona: PersonaProfile, job: JobRequirements) -> FrozenSet[str]:
+        """
+        Combine persona and job keywords into one immutable set.
+        
+        The result is built once per call and shared by every section and
+        sentence; as a frozenset its hash is computed once for automaton
+        cache lookups.
+        """
+        return frozenset(persona.keywords).union(job.priority_keywords)
+    
+    def _score_section_texts(
+        self,
+        lowered_contents: List[str],
+        lowered_titles: List[str],
+        all_keywords: Set[str],
+        probe_terms: FrozenSet[str],
+        persona: PersonaProfile,
         job: JobRequirements
-    ) -> float:
-        """Calculate keyword-based relevance score."""
-        content_lower = section.content.lower()
-        title_lower = section.title.lower()
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the text-based component scores for a batch of sections.
         
-        # Combine persona and job keywords
-        all_keywords = persona.keywords.union(job.priority_keywords)
+        Args:
+            lowered_contents: Lowercased content of each section
+            lowered_titles: Lowercased title of each section
+            all_keywords: Combined persona and job keywords
+            probe_terms: Every term the scoring helpers look for
+            persona: User persona profile
+            job: Job requirements
         
-        if not all_keywords:
-            return 0.0
+        Returns:
+            Tuple of weighted keyword match counts and unclamped persona and
+            job scores (one row per section), and whether each section title
+            contains a high-value term
+        """
+        probe_automaton = _build_keyword_automaton(probe_terms)
+        text_scores = np.empty((len(lowered_contents), 3))
+        high_value_titles = np.empty(len(lowered_contents), dtype=bool)
+        
+        # Repeated sections with the same title and body are scored once
+        first_rows = {}
+        
+        for i, (content_lower, title_lower) in enumerate(zip(lowered_contents, lowered_titles)):
+            first_row = first_rows.setdefault((title_lower, content_lower), i)
+            if first_row != i:
+                text_scores[i] = text_scores[first_row]
+                high_value_titles[i] = high_value_titles[first_row]
+                continue
+            
+            # Find all probe terms in the content and title in one pass each
+            content_hits = self._find_terms(content_lower, probe_terms, probe_automaton)
+            title_hits = self._find_terms(title_lower, probe_terms, probe_automaton)
+            section_hits = content_hits | title_hits
+            
+            # Calculate component scores
+            text_scores[i, 0] = self._count_weighted_keyword_matches(content_hits, title_hits, all_keywords)
+            text_scores[i, 1] = self._calculate_persona_alignment(content_hits, section_hits, persona)
+            text_scores[i, 2] = self._calculate_job_alignment(content_hits, section_hits, job)
+            high_value_titles[i] = not title_hits.isdisjoint(_HIGH_VALUE_TERMS)
         
-        # Count keyword matches
-        content_matches = sum(1 for keyword in all_keywords if keyword in content_lower)
-        title_matches = sum(1 for keyword in all_keywords if keyword in title_lower)
+        return text_scores, high_value_titles
+    
+    def _collect_probe_terms(
+        self,
+        persona: PersonaProfile,
+        job: JobRequirements,
+        all_keywords: Set[str]
+    ) -> FrozenSet[str]:
+        """Collect every term the section scoring helpers look for."""
+        terms = set(all_keywords)
+        terms.update(_HIGH_VALUE_TERMS)
         
-        # Weight title matches higher
-        total_matches = content_matches + (title_matches * 2)
+        for domain in persona.expertise_domains:
+            terms.update(self._get_domain_keywords(domain))
+        for focus_area in persona.focus_areas:
+            terms.update(focus_area.lower().split())
+        terms.update(_TECHNICAL_TERMS)
+        terms.update(_INTRO_TERMS)
         
-        # Normalize by content length and keyword count
-        content_words = len(content_lower.split())
-        if content_words == 0:
-            return 0.0
+        terms.update(job.primary_goal.lower().split())
+        for need in job.information_needs:
+            terms.update(need.lower().split())
+        terms.update(_DELIVERABLE_KEYWORDS.get(job.deliverable_type, ()))
         
-        score = total_matches / math.sqrt(content_words) / math.sqrt(len(all_keywords))
-        return min(score, 1.0)
+        return frozenset(terms)
+    
+    def _find_terms(
+        self,
+        text_lower: str,
+        terms: FrozenSet[str],
+        terms_automaton: Optional['ahocorasick.Automaton']
+    ) -> Set[str]:
+        """Find which of the given terms occur in lowercased text."""
+        if terms_automaton is None:
+            return {term for term in terms if term in text_lower}
+        
+        return {term for _, term in terms_automaton.iter(text_lower)}
     
-    def _calculate_semantic_score(
+    def _count_weighted_keyword_matches(
+        self,
+        content_hits: Set[str],
+        title_hits: Set[str],
+        all_keywords: Set[str]
+    ) -> int:
+        """Count keyword matches in a section, weighting title matches higher."""
+        content_matches = len(content_hits & all_keywords)
+        title_matches = len(title_hits & all_keywords)
+        
+        return content_matches + (title_matches * 2)
+    
+    def _calculate_keyword_scores(
+        self,
+        total_matches: np.ndarray,
+        content_word_counts: np.ndarray,
+        num_keywords: int
+    ) -> np.ndarray:
+        """Calculate keyword-based relevance scores for all sections at once."""
+        scores = np.zeros(len(total_matches))
+        if not num_keywords:
+            return scores
+        
+        # Normalize by content length and keyword count; empty sections score 0
+        has_words = content_word_counts > 0
+        scores[has_words] = np.minimum(
+            total_matches[has_words] / np.sqrt(content_word_counts[has_words]) / math.sqrt(num_keywords),
+            1.0
+        )
+        return scores
+    
+    def _calculate_semantic_scores(
         self,
-        section: DocumentSection,
         persona: PersonaProfile,
         job: JobRequirements,
-        tfidf_matrix,
-        section_index: int
-    ) -> float:
-        """Calculate semantic similarity score."""
-        if tfidf_matrix is None:
-            return 0.0
-        
+        features: SectionFeatures
+    ) -> np.ndarray:
+        """Calculate semantic similarity scores for all unique section bodies at once."""
         try:
             # Create query from persona and job
             query_text = f"{persona.role} {' '.join(persona.focus_areas)} {job.primary_goal} {' '.join(job.information_needs)}"
-            query_vector = self.tfidf_vectorizer.transform([query_text])
+            if query_text in features.query_scores:
+                return features.query_scores[query_text]
             
-            # Calculate cosine similarity
-            section_vector = tfidf_matrix[section_index:section_index+1]
-            similarity = cosine_similarity(query_vector, section_vector)[0][0]
+            query_vector = features.tfidf_vectorizer.transform([query_text])
             
-            return similarity
+            # Rows are already L2-normalized, so one sparse matrix-vector
+            # product gives the cosine similarity against every section
+            scores = features.tfidf_matrix.dot(query_vector.T).toarray().ravel()
+            features.query_scores[query_text] = scores
+            return scores
         except Exception as e:
             logger.warning(f"Semantic scoring failed: {e}")
-            return 0.0
+            return np.zeros(features.tfidf_matrix.shape[0])
     
-    def _calculate_structural_score(self, section: DocumentSection) -> float:
-        """Calculate structural importance score."""
-        score = 0.0
-        
-        # Title-based scoring
-        title_lower = section.title.lower()
+    def _calculate_structural_scores(
+        self,
+        sections: List[DocumentSection],
+        high_value_titles: np.ndarray,
+        content_lengths: np.ndarray
+    ) -> np.ndarray:
+        """Calculate structural importance scores for all sections at once."""
+        page_numbers = np.array([section.page_number for section in sections])
+        first_section_nums = np.array([
+            np.nan if section.first_section_num is None else section.first_section_num
+            for section in sections
+        ])
         
         # High-value sections
-        high_value_terms = [
-            'abstract', 'introduction', 'conclusion', 'summary', 'results',
-            'methodology', 'methods', 'discussion', 'findings', 'analysis'
-        ]
+        scores = np.where(high_value_titles, 0.3, 0.0)
         
-        for term in high_value_terms:
-            if term in title_lower:
-                score += 0.3
-                break
-        
-        # Section numbering (earlier sections often more important)
-        if section.section_number:
-            try:
-                # Extract first number
-                first_num = float(section.section_number.split('.')[0])
-                if first_num <= 3:  # First few sections
-                    score += 0.2
-            except (ValueError, IndexError):
-                pass
+        # Section numbering (earlier sections often more important);
+        # unnumbered sections are NaN and never count as early
+        scores += np.where(first_section_nums <= 3, 0.2, 0.0)
         
         # Content length (moderate length preferred)
-        content_length = len(section.content.split())
-        if 50 <= content_length <= 500:
-            score += 0.2
-        elif content_length > 500:
-            score += 0.1
+        scores += np.select(
+            [(content_lengths >= 50) & (content_lengths <= 500), content_lengths > 500],
+            [0.2, 0.1],
+            0.0
+        )
         
         # Page position (earlier pages often more important)
-        if section.page_number <= 3:
-            score += 0.1
+        scores += np.where(page_numbers <= 3, 0.1, 0.0)
         
-        return min(score, 1.0)
+        return np.minimum(scores, 1.0)
     
     def _calculate_persona_alignment(
         self, 
-        section: DocumentSection, 
+        content_hits: Set[str],
+        section_hits: Set[str],
         persona: PersonaProfile
     ) -> float:
-        """Calculate alignment with persona expertise."""
-        content_lower = section.content.lower()
-        title_lower = section.title.lower()
-        
+        """Calculate alignment with persona expertise, before clamping to 1.0."""
         score = 0.0
         
         # Check expertise domain alignment
         for domain in persona.expertise_domains:
             domain_keywords = self._get_domain_keywords(domain)
-            domain_matches = sum(1 for keyword in domain_keywords 
-                               if keyword in content_lower or keyword in title_lower)
-            if domain_matches > 0:
+            if any(keyword in section_hits for keyword in domain_keywords):
                 score += 0.3
         
         # Check focus area alignment
         for focus_area in persona.focus_areas:
             focus_words = focus_area.lower().split()
-            if any(word in content_lower or word in title_lower for word in focus_words):
+            if any(word in section_hits for word in focus_words):
                 score += 0.2
         
         # Skill level adjustment
         if persona.skill_level == 'expert':
             # Prefer technical content
-            technical_terms = ['methodology', 'analysis', 'framework', 'model', 'algorithm']
-            if any(term in content_lower for term in technical_terms):
+            if not content_hits.isdisjoint(_TECHNICAL_TERMS):
                 score += 0.1
         elif persona.skill_level == 'beginner':
             # Prefer introductory content
-            intro_terms = ['introduction', 'overview', 'basic', 'fundamental', 'concept']
-            if any(term in content_lower for term in intro_terms):
+            if not content_hits.isdisjoint(_INTRO_TERMS):
                 score += 0.1
         
-        return min(score, 1.0)
+        return score
     
     def _calculate_job_alignment(
         self, 
-        section: DocumentSection, 
+        content_hits: Set[str],
+        section_hits: Set[str],
         job: JobRequirements
     ) -> float:
-        """Calculate alignment with job requirements."""
-        content_lower = section.content.lower()
-        title_lower = section.title.lower()
-        
+        """Calculate alignment with job requirements, before clamping to 1.0."""
         score = 0.0
         
         # Check primary goal alignment
         goal_words = job.primary_goal.lower().split()
-        goal_matches = sum(1 for word in goal_words 
-                          if word in content_lower or word in title_lower)
-        if goal_matches > 0:
+        if any(word in section_hits for word in goal_words):
             score += 0.4
         
         # Check information needs alignment
         for need in job.information_needs:
             need_words = need.lower().split()
-            if any(word in content_lower or word in title_lower for word in need_words):
+            if any(word in section_hits for word in need_words):
                 score += 0.2
         
         # Check deliverable type alignment
-        deliverable_keywords = {
-            'analysis': ['analysis', 'analyze', 'examination', 'evaluation'],
-            'synthesis': ['summary', 'overview', 'compilation', 'integration'],
-            'review': ['review', 'survey', 'literature', 'comprehensive'],
-            'preparation': ['methodology', 'approach', 'framework', 'procedure'],
-            'identification': ['key', 'important', 'significant', 'main'],
-            'learning': ['concept', 'principle', 'fundamental', 'theory']
-        }
-        
-        if job.deliverable_type in deliverable_keywords:
-            keywords = deliverable_keywords[job.deliverable_type]
-            if any(keyword in content_lower for keyword in keywords):
+        if job.deliverable_type in _DELIVERABLE_KEYWORDS:
+            if not content_hits.isdisjoint(_DELIVERABLE_KEYWORDS[job.deliverable_type]):
                 score += 0.2
         
-        return min(score, 1.0)
+        return score
     
     def _extract_section_subsections(
         self,
         scored_section: ScoredSection,
-        persona: PersonaProfile,
-        job: JobRequirements,
+        all_keywords: Set[str],
+        sentence_terms: FrozenSet[str],
+        sentence_automaton: Optional['ahocorasick.Automaton'],
         max_subsections: int
     ) -> List[SubSection]:
         """Extract sub-sections from a scored section."""
@@ -365,27 +648,34 @@ class RelevanceScorer:
         content = section.content
         
         # Split content into sentences
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        sentences = [
+            sentence for sentence in (s.strip() for s in _SENTENCE_SPLIT_PATTERN.split(content))
+            if len(sentence) > 20
+        ]
         
         if not sentences:
             return []
         
         # Score each sentence
-        sentence_scores = []
-        for sentence in sentences:
-            score = self._score_sentence(sentence, persona, job)
-            sentence_scores.append((sentence, score))
+        sentence_scores = [
+            self._score_sentence(sentence, all_keywords, sentence_terms, sentence_automaton)
+            for sentence in sentences
+        ]
         
-        # Sort by score and take top sentences
-        sentence_scores.sort(key=lambda x: x[1], reverse=True)
-        top_sentences = sentence_scores[:max_subsections]
+        # Take top sentences by score; sections have few sentences, so a heap
+        # beats building a NumPy array, and ties keep sentence order
+        top_indices = heapq.nlargest(
+            max_subsections, range(len(sentence_scores)), key=sentence_scores.__getitem__
+        )
         
         # Create sub-sections
         subsections = []
-        for i, (sentence, score) in enumerate(top_sentences):
+        for i in top_indices:
+            sentence = sentences[i]
+            score = sentence_scores[i]
+            
             # Expand sentence with context
-            refined_text = self._refine_sentence_with_context(sentence, sentences)
+            refined_text = self._refine_sentence_with_context(i, sentences)
             
             subsections.append(SubSection(
                 document=scored_section.document,
@@ -400,19 +690,21 @@ class RelevanceScorer:
     def _score_sentence(
         self, 
         sentence: str, 
-        persona: PersonaProfile, 
-        job: JobRequirements
+        all_keywords: Set[str],
+        sentence_terms: FrozenSet[str],
+        sentence_automaton: Optional['ahocorasick.Automaton']
     ) -> float:
         """Score a sentence for relevance."""
-        sentence_lower = sentence.lower()
+        length = len(sentence.split())
+        
+        # Find keywords and quality indicators in one scan
+        sentence_hits = self._find_terms(sentence.lower(), sentence_terms, sentence_automaton)
         
         # Keyword matching
-        all_keywords = persona.keywords.union(job.priority_keywords)
-        keyword_matches = sum(1 for keyword in all_keywords if keyword in sentence_lower)
-        keyword_score = min(keyword_matches / len(sentence.split()) * 2, 1.0)
+        keyword_matches = len(sentence_hits & all_keywords)
+        keyword_score = min(keyword_matches / length * 2, 1.0)
         
         # Length penalty (prefer moderate length)
-        length = len(sentence.split())
         if 5 <= length <= 30:
             length_score = 1.0
         elif length < 5:
@@ -422,52 +714,22 @@ class RelevanceScorer:
         
         # Content quality indicators
         quality_score = 0.0
-        quality_indicators = ['result', 'finding', 'conclusion', 'analysis', 'method', 'approach']
-        if any(indicator in sentence_lower for indicator in quality_indicators):
+        if not sentence_hits.isdisjoint(_QUALITY_INDICATORS):
             quality_score = 0.3
         
         return (keyword_score * 0.6) + (length_score * 0.2) + (quality_score * 0.2)
     
-    def _refine_sentence_with_context(self, target_sentence: str, all_sentences: List[str]) -> str:
+    def _refine_sentence_with_context(self, target_index: int, all_sentences: List[str]) -> str:
         """Refine a sentence by adding relevant context."""
-        # Find the target sentence in the list
-        target_index = -1
-        for i, sentence in enumerate(all_sentences):
-            if target_sentence.strip() in sentence:
-                target_index = i
-                break
-        
-        if target_index == -1:
-            return target_sentence
-        
         # Add context sentences (one before, one after if available)
-        context_sentences = []
-        
-        if target_index > 0:
-            context_sentences.append(all_sentences[target_index - 1])
-        
-        context_sentences.append(target_sentence)
-        
-        if target_index < len(all_sentences) - 1:
-            context_sentences.append(all_sentences[target_index + 1])
+        context_sentences = all_sentences[max(0, target_index - 1):target_index + 2]
         
         # Join and clean up
         refined_text = '. '.join(context_sentences)
-        refined_text = re.sub(r'\s+', ' ', refined_text).strip()
+        refined_text = _WHITESPACE_PATTERN.sub(' ', refined_text).strip()
         
         return refined_text
     
     def _get_domain_keywords(self, domain: str) -> List[str]:
         """Get keywords for a specific domain."""
-        domain_keywords = {
-            'computer_science': ['algorithm', 'programming', 'software', 'computing', 'data', 'neural', 'machine'],
-            'biology': ['gene', 'protein', 'cell', 'organism', 'molecular', 'genetic'],
-            'chemistry': ['reaction', 'compound', 'molecule', 'synthesis', 'organic', 'kinetics'],
-            'finance': ['revenue', 'profit', 'investment', 'market', 'financial'],
-            'medicine': ['patient', 'treatment', 'clinical', 'therapeutic', 'medical'],
-            'research': ['study', 'analysis', 'methodology', 'experiment', 'literature'],
-            'education': ['learning', 'curriculum', 'academic', 'study'],
-            'business': ['strategy', 'management', 'operations', 'marketing']
-        }
-        
-        return domain_keywords.get(domain, [])
+        return _DOMAIN_KEYWORDS.get(domain, [])
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory and on-disk analysis caches.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import _cache
+from _cache import disk_memoize, memoize
+
+
+def _make_analyzer_class():
+    """Define a counting analyzer, decorated with the cache settings in effect now."""
+    class CountingAnalyzer:
+        def __init__(self, cache_dir=None):
+            self.calls = []
+            self._memory_cache = OrderedDict()
+            self._disk_cache_dir = cache_dir
+        
+        @disk_memoize('_disk_cache_dir')
+        def analyze(self, text):
+            self.calls.append(text)
+            return {'text': text, 'length': len(text)}
+        
+        @memoize('_memory_cache', maxsize=2)
+        def analyze_in_memory(self, text):
+            self.calls.append(text)
+            return text.upper()
+    
+    return CountingAnalyzer
+
+
+def test_disk_cache_round_trip(tmp_path):
+    """A miss computes and stores the result; a later instance reads it back."""
+    analyzer_class = _make_analyzer_class()
+    
+    first = analyzer_class(cache_dir=tmp_path)
+    assert first.analyze("persona") == {'text': 'persona', 'length': 7}
+    assert first.calls == ["persona"]
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+    
+    second = analyzer_class(cache_dir=tmp_path)
+    assert second.analyze("persona") == {'text': 'persona', 'length': 7}
+    assert second.calls == []
+    
+    assert second.analyze("job") == {'text': 'job', 'length': 3}
+    assert second.calls == ["job"]
+
+
+def test_disk_cache_disabled_without_directory(tmp_path):
+    """Instances without a cache directory always compute and never write files."""
+    analyzer = _make_analyzer_class()(cache_dir=None)
+    analyzer.analyze("persona")
+    analyzer.analyze("persona")
+    assert analyzer.calls == ["persona", "persona"]
+
+
+@pytest.mark.parametrize('attribute, value', [
+    ('_DISK_CACHE_VERSION', 2),
+    ('_module_source_digest', lambda module_name: 'changed-source'),
+])
+def test_disk_cache_invalidated_by_version_or_source(tmp_path, monkeypatch, attribute, value):
+    """Entries written under another cache version or module source are not served."""
+    monkeypatch.setattr(_cache, '_module_source_digest', lambda module_name: 'original-source')
+    writer = _make_analyzer_class()(cache_dir=tmp_path)
+    writer.analyze("persona")
+    
+    monkeypatch.setattr(_cache, attribute, value)
+    reader = _make_analyzer_class()(cache_dir=tmp_path)
+    reader.analyze("persona")
+    assert reader.calls == ["persona"]
+    assert len(list(tmp_path.glob('*.pkl'))) == 2
+
+
+@pytest.mark.parametrize('corrupt_bytes', [b'not a pickle', b''])
+def test_disk_cache_recomputes_corrupt_entry(tmp_path, corrupt_bytes):
+    """A corrupt or truncated entry falls back to recomputation and is rewritten."""
+    analyzer_class = _make_analyzer_class()
+    analyzer_class(cache_dir=tmp_path).analyze("persona")
+    (cache_file,) = tmp_path.glob('*.pkl')
+    cache_file.write_bytes(corrupt_bytes)
+    
+    analyzer = analyzer_class(cache_dir=tmp_path)
+    assert analyzer.analyze("persona") == {'text': 'persona', 'length': 7}
+    assert analyzer.calls == ["persona"]
+    
+    # The rewritten entry is served again
+    reader = analyzer_class(cache_dir=tmp_path)
+    reader.analyze("persona")
+    assert reader.calls == []
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """The in-memory LRU keeps at most maxsize entries, evicting the oldest use."""
+    analyzer = _make_analyzer_class()()
+    
+    analyzer.analyze_in_memory("a")
+    analyzer.analyze_in_memory("b")
+    analyzer.analyze_in_memory("a")  # hit; "b" is now least recently used
+    analyzer.analyze_in_memory("c")  # evicts "b"
+    assert list(analyzer._memory_cache) == ["a", "c"]
+    
+    analyzer.analyze_in_memory("a")
+    analyzer.analyze_in_memory("b")
+    assert analyzer.calls == ["a", "b", "c", "b"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON and NDJSON output writing.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import output_formatter
+from output_formatter import write_ndjson, write_output
+from split_ndjson import split_ndjson
+
+
+def _sample_outputs():
+    """Small output documents with nested data, non-ASCII text and numpy values."""
+    return [
+        {
+            "metadata": {"persona": "Cardiologist researcher", "job_to_be_done": "Review évidence"},
+            "extracted_sections": [
+                {"document": "study.pdf", "section_title": "Abstract", "importance_rank": np.int64(1)}
+            ],
+            "scores": np.array([0.25, 0.5]),
+        },
+        {
+            "metadata": {"persona": "Investment Analyst", "job_to_be_done": "Analyze growth\nprospects"},
+            "extracted_sections": [],
+            "scores": np.array([], dtype=float),
+        },
+    ]
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def encoder(request, monkeypatch):
+    """Run a test on the orjson path and on the stdlib json fallback."""
+    if request.param == 'orjson':
+        if output_formatter.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(output_formatter, 'orjson', None)
+    return request.param
+
+
+def test_ndjson_split_round_trip(tmp_path, encoder):
+    """Splitting an NDJSON file reproduces the per-scenario JSON files."""
+    outputs = _sample_outputs()
+    ndjson_path = tmp_path / "comprehensive_test.ndjson"
+    write_ndjson(outputs, str(ndjson_path))
+    
+    lines = ndjson_path.read_bytes().splitlines()
+    assert len(lines) == len(outputs)
+    
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    for i, output_data in enumerate(outputs, 1):
+        write_output(output_data, str(legacy_dir / f"comprehensive_test_{i}.json"))
+    
+    split_dir = tmp_path / "split"
+    split_dir.mkdir()
+    written = split_ndjson(str(ndjson_path), str(split_dir))
+    
+    assert [os.path.basename(path) for path in written] == ["comprehensive_test_1.json", "comprehensive_test_2.json"]
+    for path in written:
+        legacy_file = legacy_dir / os.path.basename(path)
+        assert json.loads(open(path, encoding='utf-8').read()) == json.loads(legacy_file.read_text(encoding='utf-8'))
+    assert not list(tmp_path.rglob('*.tmp'))
+
+
+def test_write_output_compact(tmp_path, encoder):
+    """indent=False writes single-line JSON with the same content as the indented form."""
+    output_data = _sample_outputs()[0]
+    compact_path = tmp_path / "compact.json"
+    indented_path = tmp_path / "indented.json"
+    
+    write_output(output_data, str(compact_path), indent=False)
+    write_output(output_data, str(indented_path))
+    
+    compact = compact_path.read_bytes()
+    assert b"\n" not in compact
+    assert b": " not in compact and b", " not in compact
+    assert "évidence" in compact.decode('utf-8')
+    assert json.loads(compact) == json.loads(indented_path.read_bytes())
+    assert b"\n  " in indented_path.read_bytes()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for section ranking in the relevance scorer.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from persona_analyzer import PersonaAnalyzer
+from relevance_scorer import RelevanceScorer, _top_k_indices
+from test_with_generated_data import create_ai_research_paper, create_finance_report, create_medical_study
+
+
+def test_cross_domain_ranking_order():
+    """The cross-domain scenario ranks the mock documents' sections in a fixed order."""
+    documents = [create_ai_research_paper(), create_finance_report(), create_medical_study()]
+    persona_analyzer = PersonaAnalyzer()
+    persona = persona_analyzer.analyze_persona("Healthcare Technology Consultant")
+    job = persona_analyzer.analyze_job(
+        "Identify technology trends and applications across AI, finance, and healthcare sectors"
+    )
+    
+    ranked = RelevanceScorer().score_sections(documents, persona, job, max_sections=3)
+    
+    assert [(s.section.title, s.document) for s in ranked] == [
+        ("Abstract", "cardiovascular_digital_therapy_study.pdf"),
+        ("Clinical Implications and Conclusions", "cardiovascular_digital_therapy_study.pdf"),
+        ("Abstract", "adaptive_vision_transformer_2024.pdf"),
+    ]
+    assert [s.relevance_score for s in ranked] == pytest.approx([0.3187, 0.3147, 0.3123], abs=1e-4)
+
+
+
+def _full_sort_top_k(scores, k):
+    """Reference top-k: a full stable descending sort, as used before partial selection."""
+    return np.argsort(-scores, kind='stable')[:k]
+
+
+def test_top_k_zero_and_negative_k():
+    """Non-positive k selects nothing."""
+    scores = np.array([0.3, 0.1, 0.2])
+    for k in (0, -1):
+        selected = _top_k_indices(scores, k)
+        assert selected.size == 0
+        assert selected.dtype == np.intp
+
+
+@pytest.mark.parametrize('k', [3, 4, 10])
+def test_top_k_k_at_least_n_returns_full_ranking(k):
+    """k >= n ranks every item."""
+    scores = np.array([0.3, 0.1, 0.2])
+    assert _top_k_indices(scores, k).tolist() == [0, 2, 1]
+
+
+def test_top_k_ties_keep_original_order():
+    """Equal scores keep their input order, including ties at the cut-off."""
+    scores = np.array([0.5, 0.2, 0.5, 0.2, 0.9, 0.2])
+    assert _top_k_indices(scores, 2).tolist() == [4, 0]
+    assert _top_k_indices(scores, 3).tolist() == [4, 0, 2]
+    assert _top_k_indices(scores, 4).tolist() == [4, 0, 2, 1]
+    assert _top_k_indices(scores, 5).tolist() == [4, 0, 2, 1, 3]
+    assert _top_k_indices(np.zeros(4), 2).tolist() == [0, 1]
+
+
+def test_top_k_matches_full_argsort():
+    """Partial selection picks the same indices in the same order as a full stable sort."""
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        n = int(rng.integers(1, 40))
+        # Coarse rounding produces plenty of ties
+        scores = np.round(rng.random(n), int(rng.integers(0, 3)))
+        k = int(rng.integers(0, n + 3))
+        assert _top_k_indices(scores, k).tolist() == _full_sort_top_k(scores, k).tolist()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -3,7 +3,6 @@
 Test script for the Persona-Driven Document Intelligence system.
 """
 
-import json
 import logging
 import os
 import sys
@@ -16,7 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from document_processor import DocumentProcessor
 from persona_analyzer import PersonaAnalyzer
 from relevance_scorer import RelevanceScorer
-from output_formatter import OutputFormatter
+from output_formatter import OutputFormatter, write_output
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -138,10 +137,9 @@ def test_system_components():
         logger.error("Output format validation failed")
         return False
     
-    # Save test output
+    # Save test output (machine-checked only, so skip pretty-printing)
     output_file = "test_output.json"
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    write_output(output_data, output_file, indent=False)
     
     logger.info(f"Test output saved to {output_file}")
     return True